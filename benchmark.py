@@ -0,0 +1,451 @@
+#!/usr/bin/env python3
+"""
+Offline benchmark and load-test harness for the translation bot.
+
+Runs a local stand-in for Google's `translate_a/single` endpoint, replays
+synthetic Discord traffic against the real handlers in bot.py and reports
+throughput, latency percentiles and upstream call counts.
+
+Usage:
+    python benchmark.py --events 500 --concurrency 20 --latency-ms 50
+    python benchmark.py --max-p95-ms 250 --min-throughput 50   # CI gate
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import random
+import sys
+import time
+from collections import Counter
+from types import SimpleNamespace
+
+import aiohttp
+from aiohttp import web
+
+import bot as translate_bot
+
+# ---------------- SYNTHETIC TRAFFIC ----------------
+FOREIGN_MESSAGES = [
+    "Xin chào các bạn, hôm nay thế nào?",
+    "¿Alguien quiere jugar esta noche?",
+    "Привет всем, как дела?",
+    "Je suis en retard, désolé à tous !",
+    "Guten Morgen, habt ihr gut geschlafen?",
+    "こんにちは、元気ですか？",
+    "안녕하세요, 반갑습니다",
+    "Olá pessoal, tudo bem com vocês?",
+]
+
+ENGLISH_MESSAGES = [
+    "Hello everyone, how is it going?",
+    "Anyone up for a game tonight?",
+    "I'll be a few minutes late, sorry!",
+    "Good morning, did you sleep well?",
+]
+
+REPLY_COMMANDS = ["!vn", "!es", "!fr", "!de", "!jp", "!kr", "!cn", "!ru"]
+
+EDIT_DEBOUNCE = 0.05  # Shorter than the bot's default so edit bursts don't dominate wall time
+
+# (event kind, weight)
+TRAFFIC_MIX = [
+    ("auto_foreign", 50),
+    ("auto_english", 20),
+    ("reply_shortcut", 20),
+    ("translate_command", 7),
+    ("languages_command", 3),
+    ("message_edit", 10),
+]
+
+
+# ---------------- FAKE TRANSLATION SERVER ----------------
+class FakeTranslateServer:
+    """Local aiohttp stand-in for translate_a/single"""
+
+    def __init__(self, latency_ms=0.0, jitter_ms=0.0, error_rate=0.0, rate_limit_rate=0.0, seed=None):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.calls = 0
+        self.last_query = None
+        self.statuses = Counter()
+        self._random = random.Random(seed)
+        self._runner: web.AppRunner | None = None
+        self.url = None
+
+        self.app = web.Application()
+        self.app.router.add_get("/translate_a/single", self.handle_translate)
+
+    async def handle_translate(self, request):
+        """Mimic the nested-array response of the unofficial Google API"""
+        self.calls += 1
+
+        delay = self.latency_ms + self._random.uniform(0, self.jitter_ms)
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
+
+        roll = self._random.random()
+        if roll < self.rate_limit_rate:
+            self.statuses[429] += 1
+            return web.Response(status=429, text="Too Many Requests")
+        if roll < self.rate_limit_rate + self.error_rate:
+            self.statuses[500] += 1
+            return web.Response(status=500, text="Internal Server Error")
+
+        text = request.query.get("q", "")
+        self.last_query = text
+        target = request.query.get("tl", "en")
+        source = "en" if text.isascii() else "xx"
+        # Translate line by line, like the real API does
+        translated = "\n".join(line if source == target else f"[{target}] {line}" for line in text.split("\n"))
+
+        self.statuses[200] += 1
+        return web.json_response([[[translated, text, None, None]], None, source])
+
+    async def start(self):
+        self._runner = web.AppRunner(self.app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        host, port = self._runner.addresses[0][:2]
+        self.url = f"http://{host}:{port}/translate_a/single"
+        return self.url
+
+    async def stop(self):
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+
+# ---------------- STUB DISCORD OBJECTS ----------------
+class StubUser:
+    def __init__(self, user_id, name, bot=False):
+        self.id = user_id
+        self.name = name
+        self.display_name = name
+        self.bot = bot
+        self.display_avatar = SimpleNamespace(url=f"https://cdn.example.invalid/avatars/{user_id}.png")
+
+
+class StubChannel:
+    """Channel that keeps its messages in memory and simulates Discord API latency"""
+
+    def __init__(self, channel_id, api_latency_ms=0.0):
+        self.id = channel_id
+        self.api_latency_ms = api_latency_ms
+        self.messages = {}
+        self.api_calls = 0
+        self._next_id = channel_id * 1_000_000
+
+    def new_message(self, content, author, reference=None):
+        self._next_id += 1
+        message = StubMessage(self._next_id, content, author, self, reference)
+        self.messages[message.id] = message
+        return message
+
+    async def _api_call(self):
+        self.api_calls += 1
+        if self.api_latency_ms > 0:
+            await asyncio.sleep(self.api_latency_ms / 1000)
+
+    async def fetch_message(self, message_id):
+        await self._api_call()
+        return self.messages[message_id]
+
+    async def send(self, content=None, embed=None, **kwargs):
+        await self._api_call()
+        return self.new_message(content or "", BOT_USER)
+
+
+class StubMessage:
+    def __init__(self, message_id, content, author, channel, reference=None):
+        self.id = message_id
+        self.content = content
+        self.author = author
+        self.channel = channel
+        self.reference = reference
+        self.embeds = []
+        self.edits = 0
+
+    async def reply(self, content=None, embed=None, **kwargs):
+        sent = await self.channel.send(content=content, embed=embed)
+        sent.reference = SimpleNamespace(message_id=self.id)
+        if embed is not None:
+            sent.embeds.append(embed)
+        return sent
+
+    async def edit(self, content=None, embed=None, **kwargs):
+        await self.channel._api_call()
+        if content is not None:
+            self.content = content
+        if embed is not None:
+            self.embeds = [embed]
+        self.edits += 1
+        return self
+
+    async def delete(self, **kwargs):
+        await self.channel._api_call()
+        self.channel.messages.pop(self.id, None)
+
+
+class StubContext:
+    """Just enough of commands.Context for the prefix command callbacks"""
+
+    def __init__(self, message):
+        self.message = message
+        self.author = message.author
+        self.channel = message.channel
+
+    async def reply(self, content=None, **kwargs):
+        return await self.message.reply(content, **kwargs)
+
+    async def send(self, content=None, **kwargs):
+        return await self.channel.send(content, **kwargs)
+
+
+BOT_USER = StubUser(1, "TranslateBot", bot=True)
+
+
+async def dispatch_command(message):
+    """Route prefix commands to the real command callbacks without a gateway connection"""
+    parts = message.content.split()
+    if not parts or not parts[0].startswith(translate_bot.bot.command_prefix):
+        return
+
+    command = translate_bot.bot.get_command(parts[0][1:])
+    if command is None:
+        return
+
+    args = parts[1:1 + len(command.clean_params)]
+    await command.callback(StubContext(message), *args)
+
+
+# ---------------- DRIVER ----------------
+def generate_events(count, seed=None):
+    """Build a deterministic list of (kind, content, extra) events
+    extra is the replied-to text for commands and the list of edits for edits
+    """
+    rng = random.Random(seed)
+    kinds = [kind for kind, _ in TRAFFIC_MIX]
+    weights = [weight for _, weight in TRAFFIC_MIX]
+
+    events = []
+    for kind in rng.choices(kinds, weights=weights, k=count):
+        if kind == "auto_foreign":
+            events.append((kind, rng.choice(FOREIGN_MESSAGES), None))
+        elif kind == "auto_english":
+            events.append((kind, rng.choice(ENGLISH_MESSAGES), None))
+        elif kind == "reply_shortcut":
+            events.append((kind, rng.choice(REPLY_COMMANDS), rng.choice(FOREIGN_MESSAGES + ENGLISH_MESSAGES)))
+        elif kind == "translate_command":
+            lang = rng.choice(["vn", "jp", "es", "fr", "German"])
+            events.append((kind, f"!translate {lang}", rng.choice(FOREIGN_MESSAGES + ENGLISH_MESSAGES)))
+        elif kind == "message_edit":
+            # A burst of typo fixes ending on a rewritten second sentence
+            first, second, edited = rng.sample(FOREIGN_MESSAGES, 3)
+            burst = [f"{first} {second[:-1]}", f"{first} {edited[:len(edited) // 2]}", f"{first} {edited}"]
+            events.append((kind, f"{first} {second}", burst))
+        else:
+            events.append((kind, "!languages", None))
+    return events
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not values:
+        return 0.0
+    rank = max(1, -(-len(values) * pct // 100))
+    return values[int(rank) - 1]
+
+
+async def run_benchmark(events=200, concurrency=10, latency_ms=0.0, jitter_ms=0.0,
+                        error_rate=0.0, rate_limit_rate=0.0, discord_latency_ms=0.0,
+                        edit_debounce=EDIT_DEBOUNCE, seed=42, verbose=False):
+    """Replay synthetic traffic against bot.py and return a report dict"""
+    server = FakeTranslateServer(latency_ms, jitter_ms, error_rate, rate_limit_rate, seed)
+    await server.start()
+
+    original_url = translate_bot.TRANSLATE_URL
+    original_session = translate_bot.http_session
+    original_dispatch = translate_bot.bot.__dict__.get("process_commands")
+    original_debounce = translate_bot.EDIT_DEBOUNCE_SECONDS
+    original_languages = (translate_bot.LANGUAGES, translate_bot.COMMAND_ALIASES)
+
+    channel = StubChannel(100, discord_latency_ms)
+    users = [StubUser(1000 + i, f"user{i}") for i in range(20)]
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = {}
+    failures = Counter()
+
+    async def run_event(index, kind, content, extra):
+        author = users[index % len(users)]
+        reference = None
+        if extra is not None and kind != "message_edit":
+            target = channel.new_message(extra, users[(index + 1) % len(users)])
+            reference = SimpleNamespace(message_id=target.id)
+        message = channel.new_message(content, author, reference)
+
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                await translate_bot.on_message(message)
+                if kind == "message_edit":
+                    for text in extra:
+                        before = SimpleNamespace(content=message.content)
+                        message.content = text
+                        await translate_bot.on_message_edit(before, message)
+                        pending = translate_bot.pending_edits[message.id]
+                        # Edits inside one burst land well within the debounce window
+                        await asyncio.sleep(edit_debounce / len(extra))
+                    await pending
+            except Exception:
+                failures[kind] += 1
+            latencies.setdefault(kind, []).append((time.perf_counter() - start) * 1000)
+
+    session = aiohttp.ClientSession()
+    output = contextlib.nullcontext() if verbose else contextlib.redirect_stdout(io.StringIO())
+    try:
+        with output:
+            translate_bot.TRANSLATE_URL = server.url
+            translate_bot.http_session = session
+            translate_bot.bot.process_commands = dispatch_command
+            translate_bot.EDIT_DEBOUNCE_SECONDS = edit_debounce
+            translate_bot.translation_memory.clear()
+            translate_bot.translation_replies.clear()
+            await translate_bot.load_languages()
+
+            workload = generate_events(events, seed)
+            wall_start = time.perf_counter()
+            await asyncio.gather(*(run_event(i, *event) for i, event in enumerate(workload)))
+            wall_time = time.perf_counter() - wall_start
+            memory_size = len(translate_bot.translation_memory)
+    finally:
+        await session.close()
+        translate_bot.http_session = original_session
+        translate_bot.TRANSLATE_URL = original_url
+        translate_bot.EDIT_DEBOUNCE_SECONDS = original_debounce
+        translate_bot.LANGUAGES, translate_bot.COMMAND_ALIASES = original_languages
+        translate_bot.translation_memory.clear()
+        translate_bot.translation_replies.clear()
+        translate_bot.pending_edits.clear()
+        if original_dispatch is None:
+            translate_bot.bot.__dict__.pop("process_commands", None)
+        else:
+            translate_bot.bot.process_commands = original_dispatch
+        await server.stop()
+
+    all_latencies = sorted(value for values in latencies.values() for value in values)
+    replies = sum(1 for m in channel.messages.values() if m.author is BOT_USER)
+
+    return {
+        "events": events,
+        "concurrency": concurrency,
+        "wall_time_s": round(wall_time, 4),
+        "throughput_eps": round(events / wall_time, 2) if wall_time else 0.0,
+        "latency_ms": {
+            "p50": round(percentile(all_latencies, 50), 3),
+            "p95": round(percentile(all_latencies, 95), 3),
+            "p99": round(percentile(all_latencies, 99), 3),
+            "max": round(all_latencies[-1], 3) if all_latencies else 0.0,
+        },
+        "by_kind": {
+            kind: {
+                "count": len(values),
+                "p50": round(percentile(sorted(values), 50), 3),
+                "p95": round(percentile(sorted(values), 95), 3),
+            }
+            for kind, values in sorted(latencies.items())
+        },
+        "upstream_calls": server.calls,
+        "upstream_statuses": {str(status): count for status, count in sorted(server.statuses.items())},
+        "discord_api_calls": channel.api_calls,
+        "translation_memory_size": memory_size,
+        "replies_edited": sum(m.edits for m in channel.messages.values()),
+        "replies_sent": replies,
+        "handler_failures": sum(failures.values()),
+    }
+
+
+# ---------------- REPORT ----------------
+def print_report(report):
+    latency = report["latency_ms"]
+    print("=" * 60)
+    print("📊 Translation Bot Benchmark")
+    print("=" * 60)
+    print(f"Events:            {report['events']} (concurrency {report['concurrency']})")
+    print(f"Wall time:         {report['wall_time_s']:.3f}s")
+    print(f"Throughput:        {report['throughput_eps']:.1f} events/s")
+    print(f"Latency p50/p95/p99: {latency['p50']:.1f} / {latency['p95']:.1f} / {latency['p99']:.1f} ms (max {latency['max']:.1f})")
+    print(f"Upstream calls:    {report['upstream_calls']} {report['upstream_statuses']}")
+    print(f"Discord API calls: {report['discord_api_calls']}")
+    print(f"Replies sent:      {report['replies_sent']} ({report['replies_edited']} edited in place)")
+    print(f"Memory sentences:  {report['translation_memory_size']}")
+    print(f"Handler failures:  {report['handler_failures']}")
+    print("-" * 60)
+    for kind, stats in report["by_kind"].items():
+        print(f"  {kind:<20} n={stats['count']:<5} p50={stats['p50']:.1f}ms p95={stats['p95']:.1f}ms")
+    print("=" * 60)
+
+
+def check_thresholds(report, max_p95_ms=None, min_throughput=None, max_upstream_calls=None):
+    """Return a list of regression messages for CI"""
+    problems = []
+    if max_p95_ms is not None and report["latency_ms"]["p95"] > max_p95_ms:
+        problems.append(f"p95 latency {report['latency_ms']['p95']:.1f}ms > {max_p95_ms}ms")
+    if min_throughput is not None and report["throughput_eps"] < min_throughput:
+        problems.append(f"throughput {report['throughput_eps']:.1f}/s < {min_throughput}/s")
+    if max_upstream_calls is not None and report["upstream_calls"] > max_upstream_calls:
+        problems.append(f"upstream calls {report['upstream_calls']} > {max_upstream_calls}")
+    if report["handler_failures"]:
+        problems.append(f"{report['handler_failures']} handler failures")
+    return problems
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Offline load test for the translation bot")
+    parser.add_argument("--events", type=int, default=200, help="number of synthetic events")
+    parser.add_argument("--concurrency", type=int, default=10, help="events handled at once")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="fake upstream base latency")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="random extra upstream latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of 500 responses")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="fraction of 429 responses")
+    parser.add_argument("--discord-latency-ms", type=float, default=0.0, help="stub Discord API latency")
+    parser.add_argument("--edit-debounce", type=float, default=EDIT_DEBOUNCE, help="seconds to debounce message edits")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", dest="json_path", help="also write the report as JSON to this path")
+    parser.add_argument("--max-p95-ms", type=float, help="fail if p95 latency exceeds this")
+    parser.add_argument("--min-throughput", type=float, help="fail if events/s drops below this")
+    parser.add_argument("--max-upstream-calls", type=int, help="fail if upstream calls exceed this")
+    parser.add_argument("--verbose", action="store_true", help="show the bot's own log output")
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(run_benchmark(
+        events=args.events,
+        concurrency=args.concurrency,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        discord_latency_ms=args.discord_latency_ms,
+        edit_debounce=args.edit_debounce,
+        seed=args.seed,
+        verbose=args.verbose,
+    ))
+    print_report(report)
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(report, f, indent=2)
+
+    problems = check_thresholds(report, args.max_p95_ms, args.min_throughput, args.max_upstream_calls)
+    for problem in problems:
+        print(f"❌ Regression: {problem}")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
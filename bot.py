@@ -1,5 +1,15 @@
 import os
+import re
+import math
+import sys
+import hmac
+import hashlib
+import time
 import asyncio
+import threading
+import contextlib
+import traceback
+from collections import Counter, OrderedDict
 import aiohttp
 import discord
 from discord.ext import commands
@@ -12,9 +22,9 @@ load_dotenv()
 
 TOKEN = os.getenv("DISCORD_TOKEN")
 PORT = int(os.getenv("PORT", 8080))
-
-if not TOKEN:
-    raise RuntimeError("DISCORD_TOKEN missing")
+TRANSLATE_URL = os.getenv("TRANSLATE_URL", "https://translate.googleapis.com/translate_a/single")
+DEBUG_TOKEN = os.getenv("DEBUG_TOKEN")  # enables /debug/profile when set
+LOOP_LAG_THRESHOLD_MS = float(os.getenv("LOOP_LAG_THRESHOLD_MS", 200))
 
 print(f"🌐 Using Google Translate (unofficial API)")
 
@@ -37,6 +47,8 @@ async def health_check(request):
         "status": "healthy",
         "bot_ready": bot.is_ready(),
         "languages_loaded": len(LANGUAGES),
+        "loop_lag_ms": round(loop_watchdog.last_lag_ms, 1),
+        "loop_stalls": loop_watchdog.stalls,
         "service": "discord-translate-bot"
     }
     return web.json_response(status)
@@ -45,8 +57,46 @@ async def root_handler(request):
     """Root endpoint"""
     return web.Response(text="Discord Translation Bot is running!")
 
+async def debug_profile(request):
+    """Sampled profile of the event loop thread plus an asyncio task dump"""
+    if not DEBUG_TOKEN:
+        raise web.HTTPNotFound()
+    
+    auth = request.headers.get("Authorization", "")
+    if not auth.startswith("Bearer ") or not hmac.compare_digest(auth[len("Bearer "):].encode(), DEBUG_TOKEN.encode()):
+        return web.json_response({"error": "unauthorized"}, status=401)
+    
+    try:
+        seconds = float(request.query.get("seconds", 5))
+    except ValueError:
+        seconds = math.nan
+    if not math.isfinite(seconds):
+        return web.json_response({"error": "seconds must be a finite number"}, status=400)
+    seconds = min(max(seconds, 0.1), MAX_PROFILE_SECONDS)
+    
+    if profile_lock.locked():
+        return web.json_response({"error": "a profile is already running"}, status=409)
+    
+    async with profile_lock:
+        # Sample from a worker thread so the loop keeps running normally
+        samples, idle, stacks = await asyncio.to_thread(sample_stacks, threading.get_ident(), seconds)
+    
+    leaves = Counter()
+    for stack, count in stacks.items():
+        leaves[stack.rsplit(";", 1)[-1]] += count
+    
+    return web.json_response({
+        "seconds": seconds,
+        "samples": samples,
+        "idle_samples": idle,  # Loop waiting in the selector, left out of the lists below
+        "top_functions": [{"frame": frame, "samples": count} for frame, count in leaves.most_common(25)],
+        "stacks": [{"stack": stack, "samples": count} for stack, count in stacks.most_common(50)],
+        "tasks": dump_tasks()
+    })
+
 health_app.router.add_get('/health', health_check)
 health_app.router.add_get('/', root_handler)
+health_app.router.add_get('/debug/profile', debug_profile)
 
 async def start_health_server():
     """Start health check server for Koyeb"""
@@ -56,6 +106,130 @@ async def start_health_server():
     await site.start()
     print(f"🏥 Health check server running on port {PORT}")
 
+# ---------------- LOOP WATCHDOG & PROFILER ----------------
+WATCHDOG_INTERVAL = 0.1  # Seconds between event loop heartbeats
+MAX_PROFILE_SECONDS = 30
+PROFILE_SAMPLE_INTERVAL = 0.005
+MAX_TASK_FRAMES = 10
+profile_lock = asyncio.Lock()
+
+class LoopWatchdog:
+    """Measures event loop lag and logs the loop thread's stack when it stalls"""
+    
+    def __init__(self, threshold_ms=LOOP_LAG_THRESHOLD_MS, interval=WATCHDOG_INTERVAL):
+        self.threshold = threshold_ms / 1000
+        self.interval = interval
+        self.last_lag_ms = 0.0
+        self.max_lag_ms = 0.0
+        self.stalls = 0
+        self._last_beat = time.monotonic()
+        self._loop_thread_id = None
+        self._task: asyncio.Task | None = None
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+    
+    @property
+    def running(self):
+        return self._task is not None and not self._task.done()
+    
+    def start(self):
+        """Start the heartbeat task and monitor thread (call from the event loop)"""
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._stop.clear()
+        self._task = asyncio.create_task(self._heartbeat(), name="loop-watchdog")
+        self._thread = threading.Thread(target=self._monitor, name="loop-watchdog", daemon=True)
+        self._thread.start()
+    
+    async def stop(self):
+        self._stop.set()
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._thread:
+            await asyncio.to_thread(self._thread.join)
+            self._thread = None
+    
+    async def _heartbeat(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            self._last_beat = time.monotonic()
+            start = loop.time()
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, loop.time() - start - self.interval)
+            self.last_lag_ms = lag * 1000
+            self.max_lag_ms = max(self.max_lag_ms, self.last_lag_ms)
+            if lag > self.threshold:
+                print(f"🐢 Event loop lag: {self.last_lag_ms:.0f}ms")
+    
+    def _monitor(self):
+        """Runs in a thread so it can see the loop while a callback is blocking it"""
+        reported_beat = None
+        while not self._stop.wait(self.interval):
+            beat = self._last_beat
+            stalled = time.monotonic() - beat - self.interval
+            if stalled <= self.threshold or beat == reported_beat:
+                continue
+            
+            reported_beat = beat
+            self.stalls += 1
+            frame = sys._current_frames().get(self._loop_thread_id)
+            stack = "".join(traceback.format_stack(frame)) if frame else "<unavailable>\n"
+            print(f"🐢 Event loop blocked for {stalled * 1000:.0f}ms, loop thread stack:\n{stack}", end="")
+
+loop_watchdog = LoopWatchdog()
+
+def is_idle_frame(frame):
+    """True when the event loop is waiting in the selector rather than running code"""
+    code = frame.f_code
+    return code.co_name == "select" and os.path.basename(code.co_filename) == "selectors.py"
+
+def sample_stacks(thread_id, seconds, interval=PROFILE_SAMPLE_INTERVAL):
+    """Sample a thread's call stack for a while, counting selector waits separately
+    Returns: (sample_count, idle_count, Counter of busy root-to-leaf stacks joined with ';')
+    """
+    stacks = Counter()
+    samples = 0
+    idle = 0
+    deadline = time.monotonic() + seconds
+    
+    while time.monotonic() < deadline:
+        frame = sys._current_frames().get(thread_id)
+        if frame is not None and is_idle_frame(frame):
+            idle += 1
+            samples += 1
+        elif frame is not None:
+            parts = []
+            while frame is not None:
+                code = frame.f_code
+                parts.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})")
+                frame = frame.f_back
+            stacks[";".join(reversed(parts))] += 1
+            samples += 1
+        time.sleep(interval)
+    
+    return samples, idle, stacks
+
+def dump_tasks():
+    """Describe every pending asyncio task and where it is suspended"""
+    tasks = []
+    for task in asyncio.all_tasks():
+        coro = task.get_coro()
+        tasks.append({
+            "name": task.get_name(),
+            "coro": getattr(coro, "__qualname__", repr(coro)),
+            "done": task.done(),
+            "stack": [
+                f"{frame.f_code.co_filename}:{frame.f_lineno} in {frame.f_code.co_name}"
+                for frame in task.get_stack(limit=MAX_TASK_FRAMES)
+            ]
+        })
+    return tasks
+
 # ---------------- LOAD LANGUAGES ----------------
 async def load_languages():
     """Load supported languages for Google Translate"""
@@ -102,18 +276,14 @@ async def load_languages():
     
     print(f"✅ Loaded {len(LANGUAGES)} languages (Google Translate)")
 
-# ---------------- TRANSLATE FUNCTION ----------------
-# ---------------- TRANSLATE FUNCTION ----------------
-async def translate(text: str, target: str) -> tuple[str, str] | None:
+# ---------------- GOOGLE TRANSLATE API ----------------
+async def fetch_translation(text: str, target: str) -> tuple[str, str] | None:
     """Translate text using Google Translate unofficial API
     Returns: (translated_text, detected_source_language) or None
     """
-    if not text or not text.strip():
-        return None
-    
     try:
         # Google Translate unofficial endpoint
-        url = "https://translate.googleapis.com/translate_a/single"
+        url = TRANSLATE_URL
         params = {
             "client": "gtx",
             "sl": "auto",  # source language (auto-detect)
@@ -155,6 +325,114 @@ async def translate(text: str, target: str) -> tuple[str, str] | None:
         print(f"❌ Translation error: {e}")
         return None
 
+# ---------------- TRANSLATION MEMORY ----------------
+TRANSLATION_MEMORY_SIZE = 5000  # Max cached sentence translations
+SENTENCE_SEPARATOR = re.compile(r"(?<=[.!?])\s+|(?<=[。！？])\s*|\n+")
+# Initials and short forms like "e.g.", "U.S.", "Mr." that don't end a sentence
+ABBREVIATION = re.compile(r"(?:\b[A-Za-z]\.)+$|\b(?:Mr|Mrs|Ms|Dr|Prof|Sr|Jr|St|vs|etc)\.$", re.IGNORECASE)
+
+# (sentence hash, target) -> (translated sentence, detected source language)
+translation_memory: OrderedDict[tuple[str, str], tuple[str, str]] = OrderedDict()
+
+def split_segments(text: str) -> tuple[list[str], list[str]]:
+    """Split text into sentences, keeping the separators between them
+    Returns: (segments, separators) with one separator fewer than segments
+    """
+    segments, separators = [], []
+    start = 0
+    
+    for match in SENTENCE_SEPARATOR.finditer(text):
+        sep_start, sep_end = match.span()
+        if text[sep_start - 1:sep_start] in (".", "!", "?") and "\n" not in match.group():
+            # "Wait. what" or "Mr. Smith" is still the same sentence
+            if text[sep_end:sep_end + 1].islower():
+                continue
+            if text[sep_start - 1] == "." and ABBREVIATION.search(text[start:sep_start]):
+                continue
+        segments.append(text[start:sep_start])
+        separators.append(match.group())
+        start = sep_end
+    
+    segments.append(text[start:])
+    return segments, separators
+
+def memory_key(segment: str, target: str) -> tuple[str, str]:
+    return (hashlib.sha1(segment.encode()).hexdigest(), target)
+
+def remember_segment(segment: str, target: str, translated: str, source_lang: str):
+    key = memory_key(segment, target)
+    translation_memory[key] = (translated, source_lang)
+    translation_memory.move_to_end(key)
+    while len(translation_memory) > TRANSLATION_MEMORY_SIZE:
+        translation_memory.popitem(last=False)
+
+# ---------------- TRANSLATE FUNCTION ----------------
+async def translate(text: str, target: str) -> tuple[str, str] | None:
+    """Translate text sentence by sentence, only sending uncached sentences upstream
+    Returns: (translated_text, detected_source_language) or None
+    """
+    if not text or not text.strip():
+        return None
+    
+    segments, separators = split_segments(text)
+    translated = list(segments)  # Blank segments pass through untouched
+    missing = []
+    dropped = set()
+    hits = []
+    source_lang = None
+    
+    for i, segment in enumerate(segments):
+        if not segment.strip():
+            continue
+        key = memory_key(segment, target)
+        cached = translation_memory.get(key)
+        if cached:
+            translation_memory.move_to_end(key)
+            translated[i] = cached[0]
+            source_lang = source_lang or cached[1]
+            hits.append(i)
+        else:
+            missing.append(i)
+    
+    if missing:
+        # One upstream call for all new sentences, one per line
+        result = await fetch_translation("\n".join(segments[i] for i in missing), target)
+        if not result:
+            return None
+        
+        source_lang = result[1]
+        lines = result[0].split("\n")
+        if len(lines) == len(missing):
+            for i, line in zip(missing, lines):
+                translated[i] = line.strip()
+                remember_segment(segments[i], target, translated[i], source_lang)
+        else:
+            # Upstream merged or split lines, so sentences can't be matched up
+            print(f"⚠️ Sentence count mismatch ({len(lines)} != {len(missing)}), skipping translation memory")
+            if not hits:
+                return result
+            if any(missing[0] < i < missing[-1] for i in hits):
+                # Splicing around cached sentences would reorder the text
+                return await fetch_translation(text, target)
+            # The new sentences are one run, so the merged translation can take their place
+            translated[missing[0]] = " ".join(line.strip() for line in lines if line.strip())
+            dropped.update(missing[1:])
+    
+    print(f"💾 Translation memory: {len(hits)}/{len(hits) + len(missing)} sentences cached")
+    
+    pieces = []
+    for i, (segment, separator) in enumerate(zip(translated, separators + [""])):
+        if i in dropped:
+            # The merged translation before it takes over its separator
+            pieces[-1] = separator
+            continue
+        pieces += [segment, separator]
+    
+    result = "".join(pieces)
+    if not result.strip():
+        return None
+    return (result, source_lang or "auto")
+
 # ---------------- EMBED UI ----------------
 def translation_embed(original, translated, source_lang, target_lang, author):
     """Create a compact and friendly translation embed"""
@@ -197,6 +475,10 @@ async def on_ready():
     # Start health check server
     await start_health_server()
     
+    # on_ready fires again after reconnects
+    if not loop_watchdog.running:
+        loop_watchdog.start()
+    
     await load_languages()
     await bot.tree.sync()
     
@@ -242,26 +524,29 @@ async def on_message(message: discord.Message):
                     await message.reply("⚠️ The message you replied to has no text to translate.", mention_author=False)
                     return
                 
-                # Translate the message
-                result = await translate(referenced_message.content, lang_code)
-                
-                if not result:
-                    await message.reply("⚠️ Translation failed. Please try again.", mention_author=False)
-                    return
-                
-                translated, source_lang = result
-                
-                # Send translation
-                await message.reply(
-                    embed=translation_embed(
-                        referenced_message.content,
-                        translated,
-                        source_lang,
-                        target_lang_name,
-                        message.author
-                    ),
-                    mention_author=False
-                )
+                # Edits of the replied message wait until this reply is tracked
+                async with translation_lock(referenced_message.id):
+                    # Translate the message
+                    result = await translate(referenced_message.content, lang_code)
+                    
+                    if not result:
+                        await message.reply("⚠️ Translation failed. Please try again.", mention_author=False)
+                        return
+                    
+                    translated, source_lang = result
+                    
+                    # Send translation
+                    reply = await message.reply(
+                        embed=translation_embed(
+                            referenced_message.content,
+                            translated,
+                            source_lang,
+                            target_lang_name,
+                            message.author
+                        ),
+                        mention_author=False
+                    )
+                    track_reply(referenced_message.id, reply, lang_code, target_lang_name, message.author)
                 return
             except Exception as e:
                 print(f"❌ Manual translation error: {e}")
@@ -271,11 +556,28 @@ async def on_message(message: discord.Message):
     # Process other commands
     await bot.process_commands(message)
 
-    # Skip processing for automatic translation if:
-    # - Empty messages or commands
-    # - Messages starting with ! or / (commands)
-    # - Very short messages
-    if not message.content or len(message.content.strip()) < 2 or message.content.startswith('!') or message.content.startswith('/'):
+    await auto_translate(message)
+
+def is_significant_translation(original: str, translated: str) -> bool:
+    """False when the translation only differs from the original by case or punctuation"""
+    original_words = original.lower().strip().replace(".", "").replace(",", "").replace("!", "").replace("?", "").replace("¿", "").replace("¡", "")
+    translated_words = translated.lower().strip().replace(".", "").replace(",", "").replace("!", "").replace("?", "").replace("¿", "").replace("¡", "")
+    return original_words != translated_words
+
+def wants_auto_translation(content: str) -> bool:
+    """Skip empty text, very short messages and commands (starting with ! or /)"""
+    return bool(content) and len(content.strip()) >= 2 and not content.startswith(('!', '/'))
+
+async def auto_translate(message: discord.Message):
+    """Reply with an English translation of a regular chat message"""
+    # The cached message can be edited while we wait on upstream, so pin its text
+    content = message.content
+    async with translation_lock(message.id):
+        await send_auto_translation(message, content)
+
+async def send_auto_translation(message: discord.Message, content: str):
+    """Translate content to English and reply to message (caller holds translation_lock)"""
+    if not wants_auto_translation(content):
         return
 
     # Skip if languages not loaded
@@ -285,8 +587,8 @@ async def on_message(message: discord.Message):
 
     # Translate to English
     try:
-        print(f"🔄 Attempting to translate: '{message.content[:50]}...'")
-        result = await translate(message.content, "en")
+        print(f"🔄 Attempting to translate: '{content[:50]}...'")
+        result = await translate(content, "en")
         
         if not result:
             print(f"❌ Translation failed or returned None")
@@ -296,16 +598,13 @@ async def on_message(message: discord.Message):
         print(f"✅ Translation result: '{translated[:50]}...'")
         
         # Only reply if translation is different from original
-        if translated.lower().strip() != message.content.lower().strip():
+        if translated.lower().strip() != content.lower().strip():
             # Check if the difference is significant (not just punctuation)
-            original_words = message.content.lower().strip().replace(".", "").replace(",", "").replace("!", "").replace("?", "").replace("¿", "").replace("¡", "")
-            translated_words = translated.lower().strip().replace(".", "").replace(",", "").replace("!", "").replace("?", "").replace("¿", "").replace("¡", "")
-            
-            if original_words != translated_words:
+            if is_significant_translation(content, translated):
                 print(f"📤 Sending translation reply")
-                await message.reply(
+                reply = await message.reply(
                     embed=translation_embed(
-                        message.content,
+                        content,
                         translated,
                         source_lang,
                         "en",
@@ -313,15 +612,122 @@ async def on_message(message: discord.Message):
                     ),
                     mention_author=False
                 )
+                track_reply(message.id, reply, "en", "en", message.author, auto=True)
             else:
                 print(f"⏭️ Skipping - only punctuation difference")
         else:
             print(f"⏭️ Skipping - already in English or no change")
     except Exception as e:
         print(f"❌ Translation error: {e}")
-        import traceback
         traceback.print_exc()
 
+# ---------------- MESSAGE EDITS ----------------
+EDIT_DEBOUNCE_SECONDS = 2.0  # Wait for edit bursts to settle before re-translating
+TRACKED_REPLIES_SIZE = 1000  # Max source messages whose translation replies we remember
+
+# source message id -> [(reply message, target code, target label, requester, auto)]
+translation_replies: OrderedDict[int, list] = OrderedDict()
+pending_edits: dict[int, asyncio.Task] = {}
+# source message id -> [lock, holders]; held while a translation reply is being produced
+translation_locks: dict[int, list] = {}
+
+@contextlib.asynccontextmanager
+async def translation_lock(source_id):
+    """Serialize translating and replying for one source message"""
+    entry = translation_locks.setdefault(source_id, [asyncio.Lock(), 0])
+    entry[1] += 1
+    try:
+        async with entry[0]:
+            yield
+    finally:
+        entry[1] -= 1
+        if not entry[1]:
+            del translation_locks[source_id]
+
+def track_reply(source_id, reply, target_code, target_label, requester, auto=False):
+    """Remember a translation reply so it can be updated when the source is edited"""
+    translation_replies.setdefault(source_id, []).append((reply, target_code, target_label, requester, auto))
+    translation_replies.move_to_end(source_id)
+    while len(translation_replies) > TRACKED_REPLIES_SIZE:
+        translation_replies.popitem(last=False)
+
+@bot.event
+async def on_message_edit(before: discord.Message, after: discord.Message):
+    # Embed previews also fire edit events, only react to text changes
+    if after.author.bot or before.content == after.content:
+        return
+    
+    # Restart the debounce timer so a burst of edits costs one re-translation,
+    # and drop any re-translation of older text that is still in flight
+    pending = pending_edits.get(after.id)
+    if pending:
+        pending.cancel()
+    pending_edits[after.id] = asyncio.create_task(retranslate_edit(after))
+
+async def retranslate_edit(message: discord.Message):
+    """Update translation replies in place once a message has stopped changing"""
+    # The cached message object keeps changing, so pin the text this task is for
+    content = message.content
+    try:
+        await asyncio.sleep(EDIT_DEBOUNCE_SECONDS)
+        
+        # A first translation may still be in flight; wait so its reply is updated, not duplicated
+        async with translation_lock(message.id):
+            await update_translation_replies(message, content)
+    finally:
+        if pending_edits.get(message.id) is asyncio.current_task():
+            del pending_edits[message.id]
+
+async def update_translation_replies(message: discord.Message, content: str):
+    """Bring every tracked reply for message in line with content (caller holds translation_lock)"""
+    tracked = translation_replies.get(message.id)
+    if not tracked:
+        # Not translated before, but the edit may have made it worth translating
+        await send_auto_translation(message, content)
+        return
+    
+    for entry in list(tracked):
+        reply, target_code, target_label, requester, auto = entry
+        try:
+            if auto and not wants_auto_translation(content):
+                # Edited into a command or nothing, auto_translate would skip it
+                print(f"🗑️ Removing translation for edited message {message.id}")
+                tracked.remove(entry)
+                await reply.delete()
+                continue
+            
+            # Unchanged sentences come from the translation memory
+            result = await translate(content, target_code)
+            if not result or message.content != content:
+                continue
+            
+            translated, source_lang = result
+            if auto and not is_significant_translation(content, translated):
+                # Edited into English, auto_translate wouldn't have replied at all
+                print(f"🗑️ Removing translation for edited message {message.id}")
+                tracked.remove(entry)
+                await reply.delete()
+                continue
+            
+            print(f"✏️ Updating translation for edited message {message.id}")
+            await reply.edit(
+                embed=translation_embed(
+                    content,
+                    translated,
+                    source_lang,
+                    target_label,
+                    requester
+                )
+            )
+        except discord.NotFound:
+            if entry in tracked:
+                tracked.remove(entry)
+        except Exception as e:
+            print(f"❌ Edit translation error: {e}")
+    
+    if not tracked:
+        translation_replies.pop(message.id, None)
+
 # ---------------- /TRANSLATE ----------------
 @bot.tree.command(name="translate", description="Translate replied message")
 @app_commands.describe(language="Target language")
@@ -458,26 +864,29 @@ async def translate_prefix_cmd(ctx, lang: str = None):
             await ctx.reply("⚠️ The message you replied to has no text to translate.", mention_author=False)
             return
         
-        # Translate the message
-        result = await translate(referenced_message.content, lang_code)
-        
-        if not result:
-            await ctx.reply("⚠️ Translation failed. Please try again.", mention_author=False)
-            return
-        
-        translated, source_lang = result
-        
-        # Send translation
-        await ctx.reply(
-            embed=translation_embed(
-                referenced_message.content,
-                translated,
-                source_lang,
-                target_lang_name,
-                ctx.author
-            ),
-            mention_author=False
-        )
+        # Edits of the replied message wait until this reply is tracked
+        async with translation_lock(referenced_message.id):
+            # Translate the message
+            result = await translate(referenced_message.content, lang_code)
+            
+            if not result:
+                await ctx.reply("⚠️ Translation failed. Please try again.", mention_author=False)
+                return
+            
+            translated, source_lang = result
+            
+            # Send translation
+            reply = await ctx.reply(
+                embed=translation_embed(
+                    referenced_message.content,
+                    translated,
+                    source_lang,
+                    target_lang_name,
+                    ctx.author
+                ),
+                mention_author=False
+            )
+            track_reply(referenced_message.id, reply, lang_code, target_lang_name, ctx.author)
     except Exception as e:
         print(f"❌ Translation error: {e}")
         await ctx.reply("⚠️ Error processing translation.", mention_author=False)
@@ -485,8 +894,13 @@ async def translate_prefix_cmd(ctx, lang: str = None):
 # ---------------- SHUTDOWN CLEANUP ----------------
 @bot.event
 async def on_close():
+    await loop_watchdog.stop()
     if http_session:
         await http_session.close()
 
 # ---------------- START ----------------
-bot.run(TOKEN)
+if __name__ == "__main__":
+    if not TOKEN:
+        raise RuntimeError("DISCORD_TOKEN missing")
+
+    bot.run(TOKEN)
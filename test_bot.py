@@ -206,6 +206,335 @@ def test_command_matching():
     
     print("✅ Command matching tests passed!")
 
+def test_benchmark_harness():
+    """Test the offline benchmark against the fake translation server"""
+    print("🧪 Testing offline benchmark harness...")
+    
+    from benchmark import run_benchmark, check_thresholds
+    
+    report = asyncio.run(run_benchmark(events=60, concurrency=5, rate_limit_rate=0.1, seed=7))
+    
+    assert report["events"] == 60, f"Should replay 60 events, got {report['events']}"
+    assert report["handler_failures"] == 0, f"Handlers should not raise, got {report['handler_failures']} failures"
+    assert report["upstream_calls"] > 0, "Benchmark should hit the fake translation server"
+    assert "429" in report["upstream_statuses"], "Fake server should inject 429 responses"
+    assert report["replies_sent"] > 0, "Bot should reply to synthetic messages"
+    assert report["latency_ms"]["p50"] <= report["latency_ms"]["p95"] <= report["latency_ms"]["p99"]
+    assert check_thresholds(report, max_upstream_calls=0), "Threshold check should flag too many upstream calls"
+    
+    import bot
+    assert not bot.translation_memory and not bot.translation_replies, "Benchmark should not leak translation state"
+    assert not bot.LANGUAGES, "Benchmark should restore LANGUAGES"
+    
+    print(f"✅ Benchmark harness tests passed! ({report['throughput_eps']:.0f} events/s)")
+
+def test_loop_watchdog():
+    """Test that blocking the event loop is detected"""
+    print("🧪 Testing event loop watchdog...")
+    
+    import time
+    from bot import LoopWatchdog
+    
+    async def block_loop():
+        watchdog = LoopWatchdog(threshold_ms=50, interval=0.01)
+        watchdog.start()
+        await asyncio.sleep(0.05)
+        time.sleep(0.3)  # Deliberately block the loop
+        await asyncio.sleep(0.05)
+        await watchdog.stop()
+        return watchdog
+    
+    watchdog = asyncio.run(block_loop())
+    
+    assert watchdog.stalls >= 1, "Watchdog should report the blocked loop"
+    assert watchdog.max_lag_ms >= 200, f"Lag should be measured, got {watchdog.max_lag_ms:.0f}ms"
+    
+    print(f"✅ Loop watchdog tests passed! (max lag {watchdog.max_lag_ms:.0f}ms)")
+
+def test_debug_profile_endpoint():
+    """Test that the profiler endpoint is protected and returns a profile"""
+    print("🧪 Testing /debug/profile endpoint...")
+    
+    import time
+    import bot
+    from aiohttp.test_utils import TestClient, TestServer
+    
+    async def busy_work(seconds):
+        deadline = time.monotonic() + seconds
+        while time.monotonic() < deadline:
+            for _ in range(500_000):  # Long enough to outlast the GIL switch interval
+                pass
+            await asyncio.sleep(0.005)  # Leave the loop idle part of the time
+    
+    async def fetch_profiles():
+        async with TestClient(TestServer(bot.health_app)) as client:
+            disabled = await client.get("/debug/profile")
+            bot.DEBUG_TOKEN = "secret"
+            try:
+                unauthorized = await client.get("/debug/profile", headers={"Authorization": "Bearer wrong"})
+                no_scheme = await client.get("/debug/profile", headers={"Authorization": "secret"})
+                not_finite = await client.get("/debug/profile?seconds=nan", headers={"Authorization": "Bearer secret"})
+                busy = asyncio.create_task(busy_work(0.3))
+                r = await client.get("/debug/profile?seconds=0.2", headers={"Authorization": "Bearer secret"})
+                await busy
+                rejected = (unauthorized.status, no_scheme.status, not_finite.status)
+                return disabled.status, rejected, r.status, await r.json()
+            finally:
+                bot.DEBUG_TOKEN = None
+    
+    disabled, rejected, status, profile = asyncio.run(fetch_profiles())
+    
+    assert disabled == 404, f"Endpoint should be disabled without DEBUG_TOKEN, got {disabled}"
+    assert rejected == (401, 401, 400), f"Wrong token, missing Bearer scheme and NaN seconds should be rejected, got {rejected}"
+    assert status == 200, f"Profile should succeed, got {status}"
+    assert profile["samples"] > profile["idle_samples"] > 0, "Profile should count busy and idle samples"
+    assert any("busy_work" in entry["stack"] for entry in profile["stacks"]), "Profile should show the busy coroutine"
+    assert not any(entry["frame"].startswith("select (selectors.py") for entry in profile["top_functions"]), "Selector waits should not count as CPU work"
+    assert any("_handle_request" in task["coro"] for task in profile["tasks"]), "Task dump should include the request handler"
+    
+    print(f"✅ Debug profile tests passed! ({profile['samples']} samples)")
+
+def test_sentence_splitting():
+    """Test that abbreviations and lowercase continuations don't split sentences"""
+    print("🧪 Testing sentence splitting...")
+    
+    from bot import split_segments
+    
+    test_cases = [
+        ("Hello. How are you?\nFine!", ["Hello.", "How are you?", "Fine!"], [" ", "\n"]),
+        ("Mr. Smith went home. OK?", ["Mr. Smith went home.", "OK?"], [" "]),
+        ("Dr. Who and e.g. Paris. Then go.", ["Dr. Who and e.g. Paris.", "Then go."], [" "]),
+        ("Plan A. B is next.", ["Plan A. B is next."], []),
+        ("Wait. what now? Yes!", ["Wait. what now?", "Yes!"], [" "]),
+        ("你好。我很好！", ["你好。", "我很好！", ""], ["", ""]),
+    ]
+    
+    for text, expected_segments, expected_separators in test_cases:
+        segments, separators = split_segments(text)
+        assert segments == expected_segments, f"Bad split for {text!r}: {segments}"
+        assert separators == expected_separators, f"Bad separators for {text!r}: {separators}"
+        assert "".join(seg + sep for seg, sep in zip(segments, separators + [""])) == text, "Split should be lossless"
+    
+    print("✅ Sentence splitting tests passed!")
+
+def test_sentence_mismatch_single_call():
+    """Test that an unmatched upstream response is reused instead of fetched again"""
+    print("🧪 Testing sentence count mismatch fallback...")
+    
+    import bot
+    
+    calls = []
+    
+    async def merged_fetch(text, target):
+        calls.append(text)
+        return ("[en] merged", "xx")
+    
+    async def translate_with_hit():
+        original_fetch = bot.fetch_translation
+        bot.fetch_translation = merged_fetch
+        bot.remember_segment("Xin chào.", "en", "[en] Hello.", "xx")
+        try:
+            return await bot.translate("Xin chào. Bạn khỏe không? Tôi khỏe!", "en")
+        finally:
+            bot.fetch_translation = original_fetch
+            bot.translation_memory.clear()
+    
+    result = asyncio.run(translate_with_hit())
+    
+    assert calls == ["Bạn khỏe không?\nTôi khỏe!"], f"Only new sentences should go upstream, once, got {calls}"
+    assert result == ("[en] Hello. [en] merged", "xx"), f"Cached and merged text should be combined, got {result}"
+    
+    print("✅ Sentence mismatch tests passed!")
+
+def test_sentence_mismatch_around_cached_sentence():
+    """Test that a merged response is not spliced around a cached sentence"""
+    print("🧪 Testing sentence count mismatch around cached sentences...")
+    
+    import bot
+    
+    calls = []
+    
+    async def merged_fetch(text, target):
+        calls.append(text)
+        return ("[en] merged" if "\n" in text else "[en] whole message", "xx")
+    
+    async def translate_with_hit():
+        original_fetch = bot.fetch_translation
+        bot.fetch_translation = merged_fetch
+        bot.remember_segment("Second one.", "en", "[en] BBB.", "xx")
+        try:
+            return await bot.translate("First one. Second one. Third one.", "en")
+        finally:
+            bot.fetch_translation = original_fetch
+            bot.translation_memory.clear()
+    
+    result = asyncio.run(translate_with_hit())
+    
+    assert calls == ["First one.\nThird one.", "First one. Second one. Third one."], f"Should fall back to the whole message, got {calls}"
+    assert result == ("[en] whole message", "xx"), f"Translation should keep the user's sentence order, got {result}"
+    
+    print("✅ Cached sentence mismatch tests passed!")
+
+def run_edit_scenario(scenario, latency_ms=0.0):
+    """Run scenario(server, channel, author) against the fake server, restoring bot state afterwards"""
+    import aiohttp
+    import bot
+    from benchmark import FakeTranslateServer, StubChannel, StubUser
+    
+    async def run():
+        server = FakeTranslateServer(latency_ms=latency_ms, seed=1)
+        await server.start()
+        original = (bot.TRANSLATE_URL, bot.EDIT_DEBOUNCE_SECONDS, bot.LANGUAGES, bot.COMMAND_ALIASES)
+        bot.TRANSLATE_URL, bot.http_session = server.url, aiohttp.ClientSession()
+        bot.EDIT_DEBOUNCE_SECONDS = 0.05
+        await bot.load_languages()
+        try:
+            return await scenario(server, StubChannel(1), StubUser(2, "user"))
+        finally:
+            await bot.http_session.close()
+            bot.http_session = None
+            bot.TRANSLATE_URL, bot.EDIT_DEBOUNCE_SECONDS, bot.LANGUAGES, bot.COMMAND_ALIASES = original
+            bot.translation_memory.clear()
+            bot.translation_replies.clear()
+            bot.pending_edits.clear()
+            bot.translation_locks.clear()
+            await server.stop()
+    
+    return asyncio.run(run())
+
+async def edit_message(message, text):
+    """Apply an edit the way discord.py does and return the scheduled re-translation"""
+    import bot
+    from types import SimpleNamespace
+    
+    before = SimpleNamespace(content=message.content)
+    message.content = text
+    await bot.on_message_edit(before, message)
+    return bot.pending_edits[message.id]
+
+def test_edit_retranslation():
+    """Test that edit bursts re-translate only changed sentences, once, in place"""
+    print("🧪 Testing incremental re-translation on edits...")
+    
+    import bot
+    
+    async def edit_burst(server, channel, author):
+        message = channel.new_message("Xin chào. Bạn khỏe không?", author)
+        await bot.auto_translate(message)
+        calls_after_post = server.calls
+        
+        for text in ["Xin chào. Bạn khỏe khôn?", "Xin chào. Bạn khỏe không", "Xin chào. Tôi khỏe!"]:
+            task = await edit_message(message, text)
+        await task
+        
+        reply = bot.translation_replies[message.id][0][0]
+        settled = message.id not in bot.pending_edits and not bot.translation_locks
+        return calls_after_post, server.calls, server.last_query, reply, len(channel.messages), settled
+    
+    calls_after_post, calls, last_query, reply, message_count, settled = run_edit_scenario(edit_burst)
+    
+    assert calls_after_post == 1, f"First translation should take one upstream call, got {calls_after_post}"
+    assert calls == 2, f"Edit burst should cost one upstream call, got {calls - 1}"
+    assert last_query == "Tôi khỏe!", f"Only the changed sentence should be sent, got {last_query!r}"
+    assert reply.edits == 1, f"Reply should be edited in place once, got {reply.edits}"
+    assert message_count == 2, "Edits should not post new replies"
+    assert "Tôi khỏe!" in reply.embeds[0].fields[0].value, "Reply should show the edited text"
+    assert settled, "Finished edits should not leave pending tasks or locks behind"
+    
+    print("✅ Edit re-translation tests passed!")
+
+def test_edit_in_flight_superseded():
+    """Test that a newer edit wins over a slower re-translation already in flight"""
+    print("🧪 Testing overlapping edit re-translations...")
+    
+    import bot
+    
+    async def overlapping_edits(server, channel, author):
+        message = channel.new_message("Xin chào. Bạn khỏe không?", author)
+        await bot.auto_translate(message)
+        
+        await edit_message(message, "Xin chào. Bạn khỏe khôn?")
+        await asyncio.sleep(0.15)  # Debounce has passed, upstream call is in flight
+        await (await edit_message(message, "Xin chào. Tôi khỏe!"))
+        await asyncio.sleep(0.4)  # Give a stale task time to finish if it wasn't cancelled
+        
+        return bot.translation_replies[message.id][0][0]
+    
+    reply = run_edit_scenario(overlapping_edits, latency_ms=300)
+    embed = reply.embeds[0]
+    
+    assert reply.edits == 1, f"Only the latest edit should update the reply, got {reply.edits} edits"
+    assert embed.fields[0].value == "Xin chào. Tôi khỏe!", f"Reply should show the latest text, got {embed.fields[0].value!r}"
+    assert "[en] Tôi khỏe!" in embed.description, f"Translation should match the latest text, got {embed.description!r}"
+    
+    print("✅ Overlapping edit tests passed!")
+
+def test_edit_during_first_translation():
+    """Test that an edit arriving while the first translation is in flight updates that reply"""
+    print("🧪 Testing edits during a slow first translation...")
+    
+    import bot
+    
+    async def edit_while_translating(server, channel, author):
+        message = channel.new_message("Xin chào. Bạn khỏe không?", author)
+        first = asyncio.create_task(bot.auto_translate(message))
+        await asyncio.sleep(0.1)  # First upstream call is in flight
+        await (await edit_message(message, "Xin chào. Tôi khỏe!"))
+        await first
+        
+        replies = [m for m in channel.messages.values() if m.author.bot]
+        return replies, bot.translation_replies[message.id]
+    
+    replies, tracked = run_edit_scenario(edit_while_translating, latency_ms=300)
+    
+    assert len(replies) == 1, f"Edit should update the in-flight reply, not post another, got {len(replies)} replies"
+    assert len(tracked) == 1 and tracked[0][0] is replies[0], "The first reply should be tracked"
+    embed = replies[0].embeds[0]
+    assert embed.fields[0].value == "Xin chào. Tôi khỏe!", f"Reply should show the edited text, got {embed.fields[0].value!r}"
+    assert "[en] Tôi khỏe!" in embed.description, f"Translation should match the edited text, got {embed.description!r}"
+    
+    print("✅ Edit during first translation tests passed!")
+
+def test_edit_into_command_removes_reply():
+    """Test that an auto-translation is removed once the message is edited into a command"""
+    print("🧪 Testing edits into commands...")
+    
+    import bot
+    
+    async def edit_to_command(server, channel, author):
+        message = channel.new_message("Xin chào. Bạn khỏe không?", author)
+        await bot.auto_translate(message)
+        calls = server.calls
+        await (await edit_message(message, "!cmd"))
+        return message.id in bot.translation_replies, len(channel.messages), server.calls - calls
+    
+    still_tracked, message_count, edit_calls = run_edit_scenario(edit_to_command)
+    
+    assert not still_tracked, "Deleted reply should no longer be tracked"
+    assert message_count == 1, "Auto reply should be deleted once the message is a command"
+    assert edit_calls == 0, f"Commands should not be translated, got {edit_calls} upstream calls"
+    
+    print("✅ Edit into command tests passed!")
+
+def test_edit_into_english_removes_reply():
+    """Test that an auto-translation is removed once the message is edited into English"""
+    print("🧪 Testing edits that no longer need translating...")
+    
+    import bot
+    
+    async def edit_to_english(server, channel, author):
+        message = channel.new_message("Xin chào. Bạn khỏe không?", author)
+        await bot.auto_translate(message)
+        await (await edit_message(message, "Hello. How are you?"))
+        return message.id in bot.translation_replies, len(channel.messages)
+    
+    still_tracked, message_count = run_edit_scenario(edit_to_english)
+    
+    assert not still_tracked, "Deleted reply should no longer be tracked"
+    assert message_count == 1, "Reply repeating the user's own text should be deleted"
+    
+    print("✅ Edit into English tests passed!")
+
 async def main():
     """Run all tests"""
     print("=" * 60)
@@ -217,6 +546,19 @@ async def main():
     test_language_codes()
     test_command_matching()
     
+    # The benchmark runs its own event loop
+    await asyncio.to_thread(test_benchmark_harness)
+    await asyncio.to_thread(test_loop_watchdog)
+    await asyncio.to_thread(test_debug_profile_endpoint)
+    test_sentence_splitting()
+    await asyncio.to_thread(test_sentence_mismatch_single_call)
+    await asyncio.to_thread(test_sentence_mismatch_around_cached_sentence)
+    await asyncio.to_thread(test_edit_retranslation)
+    await asyncio.to_thread(test_edit_in_flight_superseded)
+    await asyncio.to_thread(test_edit_during_first_translation)
+    await asyncio.to_thread(test_edit_into_command_removes_reply)
+    await asyncio.to_thread(test_edit_into_english_removes_reply)
+    
     # Run async tests
     await test_translation()
     